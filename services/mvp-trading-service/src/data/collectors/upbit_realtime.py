@@ -27,6 +27,33 @@ from dotenv import load_dotenv
 from influxdb_client import InfluxDBClient, Point
 from influxdb_client.client.write_api import ASYNCHRONOUS
 
+# orjson 임포트 (선택사항)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    print("✅ orjson 사용 가능")
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+    print("⚠️ orjson 없음 - 표준 json 사용")
+
+# uvloop 임포트 (선택사항)
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+    print("✅ uvloop 사용 가능")
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    print("⚠️ uvloop 없음 - 기본 asyncio 이벤트 루프 사용")
+
 load_dotenv()
 
 # 로깅 설정
@@ -356,12 +383,20 @@ class RealtimeDataBuffer:
 class SystemMonitor:
     """시스템 성능 모니터링"""
 
+    def __init__(self):
+        # cpu_percent(interval=None)는 첫 호출 시 의미 없는 0.0을 반환하므로
+        # 생성 시 한 번 호출해 이후 조회가 실제 구간을 측정하도록 함
+        self.process = psutil.Process()
+        psutil.cpu_percent(interval=None)
+        self.process.cpu_percent(interval=None)
+
     def get_system_stats(self) -> Dict[str, Any]:
         """시스템 통계 조회"""
-        process = psutil.Process()
+        process = self.process
 
         return {
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
+            # interval=None: 직전 호출 이후 사용률 (이벤트 루프를 0.1초씩 막지 않음)
+            "cpu_percent": psutil.cpu_percent(interval=None),
             "memory_percent": psutil.virtual_memory().percent,
             "memory_usage_mb": process.memory_info().rss / 1024 / 1024,
             "process_cpu_percent": process.cpu_percent(),
@@ -389,6 +424,20 @@ class UpbitRealtimeCollector:
         self.ticker_processed = 0
         self.orderbook_processed = 0
         self.start_time = time.time()
+        self.stats_print_interval = 30.0  # 통계 출력 최소 간격 (초)
+        self._last_stats_print = time.monotonic()
+
+        # 수신/처리 분리 큐 (소켓 수신이 저장/캐싱 처리 속도에 묶이지 않도록)
+        self.processing_queue_size = 1024
+        self.processing_drain_timeout = 10.0  # 종료 시 남은 큐 처리 대기 시간 (초)
+        self.processing_queue: Optional[asyncio.Queue] = None
+
+        # 타임스탬프 문자열 캐시 (초 단위 부분은 초가 바뀔 때만 strftime)
+        self._ts_second: Optional[int] = None
+        self._ts_prefix = ""
+
+        # 구독 메시지 캐시 ((스트림 타입, 심볼 튜플) -> 직렬화된 페이로드)
+        self._subscribe_payloads: Dict[tuple, str] = {}
 
         # 성능 모니터링
         self.system_monitor = SystemMonitor()
@@ -417,14 +466,20 @@ class UpbitRealtimeCollector:
             # 2. 스트림 구독
             await self._subscribe_streams(symbols)
 
-            # 3. 동시 스트림 수신 시작
+            # 3. 동시 스트림 수신 시작 (수신 루프는 큐에 넣기만, 처리는 별도 코루틴)
             logger.info("🎧 업비트 실시간 수집 시작...")
 
-            await asyncio.gather(
-                self._collect_ticker_data(),
-                self._collect_orderbook_data(),
-                return_exceptions=True,
-            )
+            self.processing_queue = asyncio.Queue(maxsize=self.processing_queue_size)
+            consumer = asyncio.create_task(self._consume_processing_queue())
+
+            try:
+                await asyncio.gather(
+                    self._collect_ticker_data(),
+                    self._collect_orderbook_data(),
+                    return_exceptions=True,
+                )
+            finally:
+                await self._stop_consumer(consumer)
 
         except Exception as e:
             logger.error(f"❌ 실시간 수집 오류: {e}")
@@ -477,22 +532,32 @@ class UpbitRealtimeCollector:
             logger.error(f"❌ WebSocket 연결 실패: {e}")
             return False
 
+    def _get_subscribe_payload(self, stream_type: str, symbols: list) -> str:
+        """구독 메시지 직렬화 (스트림 타입 + 심볼 조합별로 한 번만 생성)"""
+        key = (stream_type, tuple(symbols))
+        payload = self._subscribe_payloads.get(key)
+        if payload is None:
+            payload = _json_dumps(
+                [
+                    {"ticket": str(uuid.uuid4())},
+                    {"type": stream_type, "codes": list(symbols)},
+                ]
+            )
+            self._subscribe_payloads[key] = payload
+        return payload
+
     async def _subscribe_streams(self, symbols: list = ["KRW-BTC"]):
         """스트림 구독"""
         try:
             # 현재가 구독
-            ticker_message = [
-                {"ticket": str(uuid.uuid4())},
-                {"type": "ticker", "codes": symbols},
-            ]
-            await self.ticker_websocket.send(json.dumps(ticker_message))
+            await self.ticker_websocket.send(
+                self._get_subscribe_payload("ticker", symbols)
+            )
 
             # 오더북 구독
-            orderbook_message = [
-                {"ticket": str(uuid.uuid4())},
-                {"type": "orderbook", "codes": symbols},
-            ]
-            await self.orderbook_websocket.send(json.dumps(orderbook_message))
+            await self.orderbook_websocket.send(
+                self._get_subscribe_payload("orderbook", symbols)
+            )
 
             logger.info(f"📡 스트림 구독 시작: {symbols}")
 
@@ -507,14 +572,11 @@ class UpbitRealtimeCollector:
                     break
 
                 try:
-                    if isinstance(message, bytes):
-                        message = message.decode("utf-8")
-
-                    data = json.loads(message)
+                    # 업비트는 바이너리 프레임으로 전송 - 디코딩 없이 바이트 그대로 파싱
+                    data = _json_loads(message)
 
                     if data.get("type") == "ticker":
-                        ticker_data = self._format_ticker_data(data)
-                        await self._process_data(ticker_data)
+                        await self.processing_queue.put(data)
 
                 except Exception as e:
                     logger.error(f"❌ 현재가 메시지 처리 실패: {e}")
@@ -532,14 +594,11 @@ class UpbitRealtimeCollector:
                     break
 
                 try:
-                    if isinstance(message, bytes):
-                        message = message.decode("utf-8")
-
-                    data = json.loads(message)
+                    # 업비트는 바이너리 프레임으로 전송 - 디코딩 없이 바이트 그대로 파싱
+                    data = _json_loads(message)
 
                     if data.get("type") == "orderbook":
-                        orderbook_data = self._format_orderbook_data(data)
-                        await self._process_data(orderbook_data)
+                        await self.processing_queue.put(data)
 
                 except Exception as e:
                     logger.error(f"❌ 오더북 메시지 처리 실패: {e}")
@@ -549,6 +608,47 @@ class UpbitRealtimeCollector:
         except Exception as e:
             logger.error(f"❌ 오더북 수집 오류: {e}")
 
+    async def _stop_consumer(self, consumer: asyncio.Task):
+        """소비 코루틴 종료 (남은 메시지 처리 후 종료, 제한 시간 내 끝나지 않으면 취소)"""
+        timeout = self.processing_drain_timeout
+
+        if not consumer.done():
+            try:
+                self.processing_queue.put_nowait(None)
+            except asyncio.QueueFull:
+                # 큐가 가득 찬 경우 자리가 날 때까지만 대기 (소비가 멈췄으면 취소)
+                try:
+                    await asyncio.wait_for(self.processing_queue.put(None), timeout)
+                except asyncio.TimeoutError:
+                    consumer.cancel()
+            await asyncio.wait({consumer}, timeout=timeout)
+
+        if not consumer.done():
+            consumer.cancel()
+            await asyncio.wait({consumer}, timeout=1.0)
+
+        if consumer.done() and not consumer.cancelled() and consumer.exception():
+            logger.error(f"❌ 수신 데이터 처리 코루틴 오류: {consumer.exception()!r}")
+        if not self.processing_queue.empty():
+            logger.warning(
+                f"⚠️ 처리 큐 종료: 미처리 메시지 {self.processing_queue.qsize()}건 폐기"
+            )
+
+    async def _consume_processing_queue(self):
+        """수신 큐 소비: 포맷팅 후 통합 처리 (None 수신 시 종료)"""
+        while True:
+            data = await self.processing_queue.get()
+            if data is None:
+                break
+
+            try:
+                if data.get("type") == "ticker":
+                    await self._process_data(self._format_ticker_data(data))
+                else:
+                    await self._process_data(self._format_orderbook_data(data))
+            except Exception as e:
+                logger.error(f"❌ 수신 데이터 처리 실패: {e}")
+
     async def _process_data(self, data: Dict[str, Any]):
         """데이터 처리 (통합)"""
         try:
@@ -574,14 +674,26 @@ class UpbitRealtimeCollector:
             elif data.get("data_type") == "orderbook":
                 self.orderbook_processed += 1
 
-            # 5. 주기적 통계 출력
-            total_processed = self.ticker_processed + self.orderbook_processed
-            if total_processed % 50 == 0:
+            # 5. 주기적 통계 출력 (메시지 수와 무관하게 시간 간격으로 제한)
+            now = time.monotonic()
+            if now - self._last_stats_print >= self.stats_print_interval:
+                self._last_stats_print = now
                 await self._print_collection_statistics()
 
         except Exception as e:
             logger.error(f"❌ 데이터 처리 실패: {e}")
 
+    def _set_timestamps(self, formatted: Dict[str, Any], timestamp_ms: int):
+        """timestamp(기존 문자열 형식) + timestamp_ms(epoch 밀리초) 설정"""
+        second, millis = divmod(int(timestamp_ms), 1000)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(second)
+            )
+        formatted["timestamp"] = f"{self._ts_prefix}.{millis:03d}"
+        formatted["timestamp_ms"] = timestamp_ms
+
     def _format_ticker_data(self, data: Dict[Any, Any]) -> Dict[str, Any]:
         """현재가 데이터 포맷팅"""
         formatted = {
@@ -596,36 +708,35 @@ class UpbitRealtimeCollector:
             "high_price": data.get("high_price", 0),
             "low_price": data.get("low_price", 0),
             "prev_closing_price": data.get("prev_closing_price", 0),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
         }
+        # 업비트 체결 시각 (epoch 밀리초)
+        self._set_timestamps(
+            formatted, data.get("trade_timestamp") or int(time.time() * 1000)
+        )
         return formatted
 
     def _format_orderbook_data(self, data: Dict[Any, Any]) -> Dict[str, Any]:
         """오더북 데이터 포맷팅"""
         orderbook_units = data.get("orderbook_units", [])
 
-        ask_orders = []
-        bid_orders = []
+        # 호가별 dict 생성/정렬 없이 한 번 순회로 최우선 호가와 잔량 합계 계산
+        best_ask = 0
+        best_bid = 0
+        total_ask_size = 0
+        total_bid_size = 0
+        for i, unit in enumerate(orderbook_units):
+            ask_price = unit.get("ask_price", 0)
+            bid_price = unit.get("bid_price", 0)
+            if i == 0 or ask_price < best_ask:
+                best_ask = ask_price
+            if i == 0 or bid_price > best_bid:
+                best_bid = bid_price
+            total_ask_size += unit.get("ask_size", 0)
+            total_bid_size += unit.get("bid_size", 0)
 
-        for unit in orderbook_units:
-            ask_orders.append(
-                {"price": unit.get("ask_price", 0), "size": unit.get("ask_size", 0)}
-            )
-            bid_orders.append(
-                {"price": unit.get("bid_price", 0), "size": unit.get("bid_size", 0)}
-            )
-
-        ask_orders.sort(key=lambda x: x["price"])
-        bid_orders.sort(key=lambda x: x["price"], reverse=True)
-
-        best_ask = ask_orders[0]["price"] if ask_orders else 0
-        best_bid = bid_orders[0]["price"] if bid_orders else 0
         spread = best_ask - best_bid if best_ask and best_bid else 0
         spread_percentage = (spread / best_ask * 100) if best_ask else 0
 
-        total_ask_size = sum(order["size"] for order in ask_orders)
-        total_bid_size = sum(order["size"] for order in bid_orders)
-
         formatted = {
             "data_type": "orderbook",  # 중요: 데이터 타입 명시
             "symbol": data.get("code", ""),
@@ -635,8 +746,11 @@ class UpbitRealtimeCollector:
             "spread_percentage": spread_percentage,
             "total_ask_size": total_ask_size,
             "total_bid_size": total_bid_size,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
         }
+        # 업비트 호가 생성 시각 (epoch 밀리초)
+        self._set_timestamps(
+            formatted, data.get("timestamp") or int(time.time() * 1000)
+        )
         return formatted
 
     async def _print_collection_statistics(self):
@@ -757,4 +871,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
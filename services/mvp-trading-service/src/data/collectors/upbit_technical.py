@@ -8,18 +8,21 @@
 """
 
 import asyncio
+import copy
+import json
 import logging
+import math
 import os
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import aiohttp
 import numpy as np
 import pandas as pd
-import requests
 from dotenv import load_dotenv
-from influxdb_client import InfluxDBClient, Point
-from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_client import InfluxDBClient, Point, WritePrecision
+from influxdb_client.client.write_api import SYNCHRONOUS, WriteOptions, WriteType
 
 # TA-Lib 임포트 (선택사항)
 try:
@@ -31,6 +34,45 @@ except ImportError:
     TALIB_AVAILABLE = False
     print("⚠️ TA-Lib 없음 - 기본 계산 사용")
 
+# orjson 임포트 (선택사항)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+    print("✅ orjson 사용 가능")
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+    print("⚠️ orjson 없음 - 표준 json 사용")
+
+# uvloop 임포트 (선택사항)
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+    print("✅ uvloop 사용 가능")
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    print("⚠️ uvloop 없음 - 기본 asyncio 이벤트 루프 사용")
+
+# Numba 임포트 (선택사항)
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+    print("✅ Numba 사용 가능")
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("⚠️ Numba 없음 - 순수 Python 계산 사용")
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # type: ignore[no-redef]
+        """numba.njit 대체: 함수를 그대로 반환"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -91,6 +133,11 @@ class TechnicalIndicatorConfig:
     # OBV 설정
     OBV_TREND_PERIOD = 5  # 추세 분석 기간 (일)
     OBV_MIN_DATA_POINTS = 2  # 최소 데이터 포인트
+    # 추세 회귀용 상수 (x = 0..OBV_TREND_PERIOD-1, 로드 시 1회 계산)
+    OBV_TREND_X = np.arange(OBV_TREND_PERIOD, dtype=np.float64)
+    OBV_TREND_XMEAN = float(OBV_TREND_X.mean())
+    OBV_TREND_WEIGHTS = OBV_TREND_X - OBV_TREND_XMEAN  # 중심화된 x
+    OBV_TREND_SXX = float((OBV_TREND_WEIGHTS**2).sum())
 
     # 데이터 최소 요구사항
     MIN_DATA_FOR_INDICATORS = {
@@ -114,16 +161,301 @@ class TechnicalIndicatorConfig:
         "very_strong": 100,
     }
 
-    # 수집 및 처리 설정
-    DATA_COLLECTION = {
+    # API 재시도 설정
+    RETRY_BACKOFF: float = 0.3  # 재시도 대기 기본값 (초, 지수 증가)
+    RETRY_STATUSES: Tuple[int, ...] = (429, 500, 502, 503, 504)  # 재시도 대상 응답 코드
+
+    # 수집 및 처리 설정 (모두 정수 값)
+    DATA_COLLECTION: Dict[str, int] = {
         "daily_candles": 30,  # 일봉 30개
         "hourly_candles": 24,  # 시간봉 24개
         "api_timeout": 15,  # API 타임아웃 (초)
         "max_retries": 3,  # 최대 재시도 횟수
         "batch_size": 200,  # API 한번에 가져올 최대 개수
+        "indicator_cache_size": 64,  # 보조지표 메모이제이션 최대 항목 수
+        "http_pool_size": 16,  # 업비트 API 동시 커넥션 수
+        "http_keepalive": 60,  # 유휴 커넥션 유지 시간 (초)
+        # 심볼당 캔들 요청 2건(일봉+시간봉)이 동시에 나가므로 5 × 2 = 10건 이내로 제한
+        "max_concurrent_symbols": 5,  # 동시에 분석할 최대 심볼 수
+        "max_requests_per_second": 8,  # 업비트 시세 API 초당 요청 수 (한도 10, 여유분 포함)
     }
 
 
+# ==========================================
+# 보조지표 계산 커널 (Numba JIT)
+# ==========================================
+
+_SMA_PERIODS = np.asarray(TechnicalIndicatorConfig.SMA_PERIODS, dtype=np.int64)
+
+
+@njit(cache=True)
+def _true_range(high: float, low: float, prev_close: float) -> float:
+    """True Range"""
+    return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+@njit(cache=True)
+def _wilder(avg: float, value: float, period: int) -> float:
+    """Wilder 평활 1스텝: avg = (avg * (n - 1) + 현재값) / n"""
+    return (avg * (period - 1) + value) / period
+
+
+@njit(cache=True)
+def _fused_last_indicators(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    sma_periods: np.ndarray,
+    bb_period: int,
+    bb_std_dev: float,
+    atr_period: int,
+) -> Tuple[np.ndarray, float, float, float, float]:
+    """SMA / 볼린저밴드 / ATR의 마지막 값을 한 번에 계산
+
+    Returns:
+        (sma_periods 순서의 SMA 배열, BB 상단, BB 중간, BB 하단, ATR)
+        데이터가 부족한 지표는 NaN
+    """
+    n = close.shape[0]
+
+    # 1. SMA + 볼린저밴드: 최신 봉부터 거슬러 올라가며 한 번에 누적
+    sma_values = np.full(sma_periods.shape[0], np.nan)
+    window = min(n, max(sma_periods.max(), bb_period))
+    total = 0.0
+    mean = 0.0
+    m2 = 0.0
+    for k in range(window):
+        x = close[n - 1 - k]
+        count = k + 1
+        total += x
+
+        # Welford 분산 (BB 기간까지만)
+        if count <= bb_period:
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+
+        for j in range(sma_periods.shape[0]):
+            if sma_periods[j] == count:
+                sma_values[j] = total / count
+
+    bb_upper = np.nan
+    bb_middle = np.nan
+    bb_lower = np.nan
+    if n >= bb_period:
+        std = np.sqrt(m2 / bb_period)  # 모표준편차 (TA-Lib BBANDS와 동일)
+        bb_middle = mean
+        bb_upper = mean + bb_std_dev * std
+        bb_lower = mean - bb_std_dev * std
+
+    # 2. ATR (atr_period가 0이면 생략 - 증분 상태에서 따로 구하는 경우)
+    atr = _atr_wilder(high, low, close, atr_period) if atr_period > 0 else np.nan
+
+    return sma_values, bb_upper, bb_middle, bb_lower, atr
+
+
+@njit(cache=True)
+def _atr_wilder(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> float:
+    """ATR 마지막 값 (Wilder 평활, 첫 기간 TR 평균으로 시작, TA-Lib ATR과 동일)"""
+    n = close.shape[0]
+    if n <= period:
+        return np.nan
+
+    tr_sum = 0.0
+    for i in range(1, period + 1):
+        tr_sum += _true_range(high[i], low[i], close[i - 1])
+    atr = tr_sum / period
+    for i in range(period + 1, n):
+        atr = _wilder(atr, _true_range(high[i], low[i], close[i - 1]), period)
+    return atr
+
+
+@njit(cache=True)
+def _rsi_averages(close: np.ndarray, period: int) -> Tuple[float, float]:
+    """RSI 평균 상승/하락폭 (Wilder 평활 상태), 데이터가 부족하면 NaN"""
+    n = close.shape[0]
+    if n <= period:
+        return np.nan, np.nan
+
+    # 첫 기간 평균 상승/하락폭으로 시작
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        diff = close[i] - close[i - 1]
+        if diff > 0:
+            avg_gain += diff
+        else:
+            avg_loss -= diff
+    avg_gain /= period
+    avg_loss /= period
+
+    # 이후 봉은 Wilder 평활
+    for i in range(period + 1, n):
+        diff = close[i] - close[i - 1]
+        avg_gain = _wilder(avg_gain, diff if diff > 0 else 0.0, period)
+        avg_loss = _wilder(avg_loss, -diff if diff < 0 else 0.0, period)
+
+    return avg_gain, avg_loss
+
+
+@njit(cache=True)
+def _rsi_value(avg_gain: float, avg_loss: float) -> float:
+    """평균 상승/하락폭으로 RSI 계산"""
+    total = avg_gain + avg_loss
+    return 100.0 * avg_gain / total if total != 0 else 0.0
+
+
+@njit(cache=True)
+def _rsi_wilder_last(close: np.ndarray, period: int) -> float:
+    """RSI 마지막 값 (Wilder 평활, TA-Lib RSI와 동일)"""
+    avg_gain, avg_loss = _rsi_averages(close, period)
+    return _rsi_value(avg_gain, avg_loss)
+
+
+@njit(cache=True)
+def _macd_state(
+    close: np.ndarray, fast: int, slow: int, signal: int
+) -> Tuple[float, float, float]:
+    """MACD EMA 상태 (EMA 재귀, TA-Lib MACD와 동일)
+
+    Returns:
+        (빠른 EMA, 느린 EMA, 시그널선), 데이터가 부족하면 NaN
+    """
+    n = close.shape[0]
+    first_macd = slow - 1  # 느린 EMA가 처음 나오는 봉
+    first_output = first_macd + signal - 1  # 시그널선이 처음 나오는 봉
+    if n <= first_output:
+        return np.nan, np.nan, np.nan
+
+    k_fast = 2.0 / (fast + 1)
+    k_slow = 2.0 / (slow + 1)
+    k_signal = 2.0 / (signal + 1)
+
+    # 두 EMA 모두 first_macd 봉에서 각 기간 SMA로 시작
+    ema_fast = close[first_macd - fast + 1 : first_macd + 1].mean()
+    ema_slow = close[: first_macd + 1].mean()
+    macd = ema_fast - ema_slow
+
+    # 시그널선은 첫 signal개 MACD 값의 SMA로 시작
+    signal_sum = macd
+    for i in range(first_macd + 1, first_output + 1):
+        ema_fast = k_fast * close[i] + (1.0 - k_fast) * ema_fast
+        ema_slow = k_slow * close[i] + (1.0 - k_slow) * ema_slow
+        macd = ema_fast - ema_slow
+        signal_sum += macd
+    macd_signal = signal_sum / signal
+
+    for i in range(first_output + 1, n):
+        ema_fast = k_fast * close[i] + (1.0 - k_fast) * ema_fast
+        ema_slow = k_slow * close[i] + (1.0 - k_slow) * ema_slow
+        macd = ema_fast - ema_slow
+        macd_signal = k_signal * macd + (1.0 - k_signal) * macd_signal
+
+    return ema_fast, ema_slow, macd_signal
+
+
+@njit(cache=True)
+def _macd_last(
+    close: np.ndarray, fast: int, slow: int, signal: int
+) -> Tuple[float, float, float]:
+    """MACD 마지막 값
+
+    Returns:
+        (MACD선, 시그널선, 히스토그램), 데이터가 부족하면 NaN
+    """
+    ema_fast, ema_slow, macd_signal = _macd_state(close, fast, slow, signal)
+    macd = ema_fast - ema_slow
+    return macd, macd_signal, macd - macd_signal
+
+
+def _recurrence_state(
+    close: np.ndarray, high: np.ndarray, low: np.ndarray
+) -> Tuple[float, ...]:
+    """주어진 봉까지 처리한 RSI/MACD/ATR 평활 상태
+
+    Returns:
+        (평균 상승폭, 평균 하락폭, 빠른 EMA, 느린 EMA, 시그널선, ATR),
+        시드 구간을 다 채우지 못한 지표는 NaN
+    """
+    cfg = TechnicalIndicatorConfig
+    return (
+        *_rsi_averages(close, cfg.RSI_PERIOD),
+        *_macd_state(
+            close, cfg.MACD_FAST_PERIOD, cfg.MACD_SLOW_PERIOD, cfg.MACD_SIGNAL_PERIOD
+        ),
+        _atr_wilder(high, low, close, cfg.ATR_PERIOD),
+    )
+
+
+def _advance_recurrences(
+    state: Tuple[float, ...], prev_close: float, close: float, high: float, low: float
+) -> Dict[str, Any]:
+    """평활 상태에 봉 하나를 반영해 RSI/MACD/ATR 마지막 값 계산 (O(1))
+
+    커널과 같은 식을 같은 순서로 적용하므로 전체 재계산 결과와 일치.
+    상태가 없는(NaN) 지표는 결과에서 빠지며 호출 측이 전체 계산으로 대체
+    """
+    cfg = TechnicalIndicatorConfig
+    avg_gain, avg_loss, ema_fast, ema_slow, macd_signal, atr = state
+    values: Dict[str, Any] = {}
+
+    if not math.isnan(avg_gain):
+        diff = close - prev_close
+        avg_gain = _wilder(avg_gain, diff if diff > 0 else 0.0, cfg.RSI_PERIOD)
+        avg_loss = _wilder(avg_loss, -diff if diff < 0 else 0.0, cfg.RSI_PERIOD)
+        values["rsi"] = float(_rsi_value(avg_gain, avg_loss))
+
+    if not math.isnan(ema_fast):
+        k_fast = 2.0 / (cfg.MACD_FAST_PERIOD + 1)
+        k_slow = 2.0 / (cfg.MACD_SLOW_PERIOD + 1)
+        k_signal = 2.0 / (cfg.MACD_SIGNAL_PERIOD + 1)
+        ema_fast = k_fast * close + (1.0 - k_fast) * ema_fast
+        ema_slow = k_slow * close + (1.0 - k_slow) * ema_slow
+        macd = ema_fast - ema_slow
+        macd_signal = k_signal * macd + (1.0 - k_signal) * macd_signal
+        values["macd"] = (macd, macd_signal, macd - macd_signal)
+
+    if not math.isnan(atr):
+        atr = _wilder(atr, _true_range(high, low, prev_close), cfg.ATR_PERIOD)
+        values["atr"] = float(atr)
+
+    return values
+
+
+def _warmup_kernels() -> None:
+    """JIT 컴파일(또는 캐시 로드)을 임포트 시점에 미리 수행
+
+    첫 분석 주기에 컴파일 지연이 몰리지 않도록 작은 배열로 한 번씩 호출
+    """
+    cfg = TechnicalIndicatorConfig
+    sample = np.linspace(1.0, 2.0, cfg.MACD_SLOW_PERIOD + cfg.MACD_SIGNAL_PERIOD)
+    _fused_last_indicators(
+        sample,
+        sample + 0.1,
+        sample - 0.1,
+        _SMA_PERIODS,
+        cfg.BB_PERIOD,
+        float(cfg.BB_STD_DEV),
+        cfg.ATR_PERIOD,
+    )
+    _rsi_wilder_last(sample, cfg.RSI_PERIOD)
+    _macd_last(
+        sample, cfg.MACD_FAST_PERIOD, cfg.MACD_SLOW_PERIOD, cfg.MACD_SIGNAL_PERIOD
+    )
+    _advance_recurrences(
+        _recurrence_state(sample, sample + 0.1, sample - 0.1), 1.0, 2.0, 2.1, 1.9
+    )
+
+
+if NUMBA_AVAILABLE:
+    try:
+        _warmup_kernels()
+    except Exception as e:
+        print(f"⚠️ Numba 커널 워밍업 실패: {e}")
+
+
 class UpbitTechnicalAnalyzer:
     """
     업비트 기술분석기
@@ -134,18 +466,52 @@ class UpbitTechnicalAnalyzer:
 
     def __init__(self):
         self.upbit_url = "https://api.upbit.com/v1"
+        self._http: Optional[aiohttp.ClientSession] = None
+
+        # 업비트 초당 요청 제한용 (요청 시작 시각 간격 유지)
+        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+
         self.influx_config = TechnicalInfluxConfig()
         self.influx_client = None
         self.write_api = None
+        self._sync_write_api = (
+            None  # 즉시 전송이 필요한 단발 저장용 (최초 사용 시 생성)
+        )
         self._initialize_influxdb()
 
+        # 보조지표 캐시 (캔들 미변경 시 재계산 생략, LRU)
+        self._ind_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+
+        # 심볼별 확정 봉까지의 RSI/MACD/ATR 평활 상태 (틱마다 마지막 봉만 반영)
+        self._indicator_state: Dict[str, Dict[str, Any]] = {}
+
         # 통계
         self.analysis_count = 0
         self.success_count = 0
         self.ohlcv_write_count = 0
         self.indicators_write_count = 0
+        self.write_error_count = 0
         self.start_time = time.time()
 
+        # 배치 큐에 등록했지만 전송 결과가 아직 확정되지 않은 심볼 수
+        # (다음 틱 시작 또는 종료 시 그 사이 저장 실패가 없었으면 성공으로 반영)
+        self._pending_symbols = 0
+        self._pending_error_mark = 0
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """업비트 API용 HTTP 세션 (최초 호출 시 생성, keep-alive 커넥션 재사용)"""
+        if self._http is None or self._http.closed:
+            config = TechnicalIndicatorConfig.DATA_COLLECTION
+            # 커넥션 풀 크기와 keep-alive 유지 시간을 명시 (심볼 동시 분석 시 재사용)
+            connector = aiohttp.TCPConnector(
+                limit=config["http_pool_size"],
+                keepalive_timeout=config["http_keepalive"],
+            )
+            timeout = aiohttp.ClientTimeout(total=config["api_timeout"])
+            self._http = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._http
+
     def _initialize_influxdb(self):
         """InfluxDB 클라이언트 초기화"""
         try:
@@ -156,8 +522,17 @@ class UpbitTechnicalAnalyzer:
                 timeout=30000,
             )
 
-            # 동기 방식 사용 (에러 감지 위해)
-            self.write_api = self.influx_client.write_api(write_options=SYNCHRONOUS)
+            # 배치 방식 사용 (백그라운드 전송, 실패는 콜백으로 감지)
+            self.write_api = self.influx_client.write_api(
+                write_options=WriteOptions(
+                    write_type=WriteType.batching,
+                    batch_size=5000,
+                    flush_interval=1000,
+                    jitter_interval=500,
+                    retry_interval=5000,
+                ),
+                error_callback=self._on_write_error,
+            )
 
             # 연결 테스트
             health = self.influx_client.health()
@@ -170,11 +545,61 @@ class UpbitTechnicalAnalyzer:
             logger.error(f"❌ 기술분석용 InfluxDB 초기화 실패: {e}")
             raise
 
+    def _on_write_error(
+        self, conf: Tuple[str, str, str], data: str, exception: Exception
+    ) -> None:
+        """배치 저장 실패 콜백"""
+        self.write_error_count += 1
+        logger.error(f"❌ InfluxDB 배치 저장 실패 ({conf[0]}): {exception}")
+
     # ===========================================
     # 데이터 수집 관련 메서드
     # ===========================================
 
-    def fetch_ohlcv_data(
+    async def _throttle_request(self) -> None:
+        """업비트 초당 요청 제한 준수 (요청 시작 간격을 1/초당 한도 이상으로 유지)"""
+        interval = (
+            1 / TechnicalIndicatorConfig.DATA_COLLECTION["max_requests_per_second"]
+        )
+        async with self._rate_lock:
+            now = time.monotonic()
+            if self._next_request_at > now:
+                await asyncio.sleep(self._next_request_at - now)
+                now = self._next_request_at
+            self._next_request_at = now + interval
+
+    async def _get_json(self, endpoint: str, params: Dict[str, Any]) -> Optional[Any]:
+        """업비트 API GET 요청 (일시적 오류는 지수 백오프로 재시도)"""
+        config = TechnicalIndicatorConfig.DATA_COLLECTION
+        session = self._get_http_session()
+
+        for attempt in range(config["max_retries"] + 1):
+            can_retry = attempt < config["max_retries"]
+            try:
+                await self._throttle_request()
+                async with session.get(endpoint, params=params) as response:
+                    if (
+                        response.status in TechnicalIndicatorConfig.RETRY_STATUSES
+                        and can_retry
+                    ):
+                        logger.warning(f"⚠️ API 응답 {response.status}, 재시도...")
+                    elif response.status != 200:
+                        logger.error(f"❌ API 호출 실패: {response.status}")
+                        return None
+                    else:
+                        # 원시 바이트를 바로 파싱 (문자열 디코딩 단계 생략)
+                        return _json_loads(await response.read())
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not can_retry:
+                    raise
+                logger.warning(f"⚠️ API 요청 오류 ({e!r}), 재시도...")
+
+            await asyncio.sleep(TechnicalIndicatorConfig.RETRY_BACKOFF * 2**attempt)
+
+        return None
+
+    async def fetch_ohlcv_data(
         self, market: str, interval: str, count: int
     ) -> Optional[pd.DataFrame]:
         """업비트 OHLCV 데이터 수집"""
@@ -191,50 +616,46 @@ class UpbitTechnicalAnalyzer:
 
             # API 호출
             params = {"market": market, "count": min(count, 200)}
-            response = requests.get(endpoint, params=params, timeout=15)
-
-            if response.status_code != 200:
-                logger.error(f"❌ API 호출 실패: {response.status_code}")
-                return None
-
-            data = response.json()
+            data = await self._get_json(endpoint, params)
             if not data:
                 logger.warning("⚠️ 빈 데이터 응답")
                 return None
 
-            # DataFrame 변환
-            df = pd.DataFrame(data)
-
-            # 컬럼명 정리
-            df = df.rename(
-                columns={
-                    "candle_date_time_utc": "datetime",
-                    "opening_price": "open",
-                    "high_price": "high",
-                    "low_price": "low",
-                    "trade_price": "close",
-                    "candle_acc_trade_volume": "volume",
-                    "candle_acc_trade_price": "volume_krw",
-                }
+            # DataFrame 변환: 컬럼별로 타입이 정해진 배열을 바로 생성
+            # (업비트는 최신 캔들부터 내려주므로 역순으로 읽어 시간순 정렬)
+            rows = data[::-1]
+            n = len(rows)
+
+            def column(key: str) -> np.ndarray:
+                return np.fromiter((r[key] for r in rows), dtype=np.float64, count=n)
+
+            close = column("trade_price")
+            volume = column("candle_acc_trade_volume")
+            df = pd.DataFrame(
+                {
+                    "datetime": np.array(
+                        [r["candle_date_time_utc"] for r in rows],
+                        dtype="datetime64[ns]",
+                    ),
+                    "open": column("opening_price"),
+                    "high": column("high_price"),
+                    "low": column("low_price"),
+                    "close": close,
+                    "volume": volume,
+                    # 누적 거래대금이 없는 응답이면 거래량 × 종가로 대체
+                    "volume_krw": (
+                        column("candle_acc_trade_price")
+                        if "candle_acc_trade_price" in rows[0]
+                        else volume * close
+                    ),
+                },
+                copy=False,
             )
 
-            # 필요한 컬럼만 선택
-            required_columns = ["datetime", "open", "high", "low", "close", "volume"]
-            available_columns = [col for col in required_columns if col in df.columns]
-            df = df[available_columns].copy()
-
-            # volume_krw 계산
-            if "volume_krw" not in df.columns:
-                df["volume_krw"] = df["volume"] * df["close"]
-
-            # 타입 변환
-            df["datetime"] = pd.to_datetime(df["datetime"])
-            for col in ["open", "high", "low", "close", "volume", "volume_krw"]:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
-
-            # 시간순 정렬
-            df = df.sort_values("datetime").reset_index(drop=True)
+            if not df["datetime"].is_monotonic_increasing:
+                # 응답 순서 가정이 깨진 경우에만 비교 정렬
+                logger.warning("⚠️ 예상과 다른 캔들 순서 - 정렬 수행")
+                df = df.sort_values("datetime").reset_index(drop=True)
 
             logger.info(f"✅ {market} {interval} 데이터 {len(df)}개 수집 완료")
             return df
@@ -247,494 +668,485 @@ class UpbitTechnicalAnalyzer:
     # 보조지표 계산 관련 메서드
     # ===========================================
 
-    def calculate_indicators(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """보조지표 계산"""
+    def calculate_indicators(
+        self, df: pd.DataFrame, symbol: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """보조지표 계산 (최신 캔들이 동일하면 캐시된 결과 반환)"""
         if df is None or df.empty:
             return {}
 
+        cache_key = self._indicator_cache_key(df, symbol)
+        cached = self._get_cached_indicators(cache_key)
+        if cached is not None:
+            return cached
+
+        close, high, low, volume = self._extract_arrays(df)
+        recurrences = self._recurrence_values(symbol, df, close, high, low)
+        indicators = self._compute_indicators(close, high, low, volume, recurrences)
+        self._store_indicators(cache_key, indicators)
+        return indicators
+
+    def _compute_indicators(
+        self,
+        close: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        volume: np.ndarray,
+        recurrences: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """보조지표 전체 계산 (추출한 컬럼 배열 기준)
+
+        Args:
+            recurrences: 증분 계산된 RSI/MACD/ATR 마지막 값 (없으면 전체 계산)
+        """
+        cfg = TechnicalIndicatorConfig  # 전역/속성 조회를 지역 변수로 1회 바인딩
         indicators = {}
-        data_length = len(df)
+        data_length = len(close)
         logger.info(f"📊 데이터 길이: {data_length}개")
 
         try:
+            current_price = float(close[-1])
+            incremental_atr = (recurrences or {}).get("atr")
+
+            # SMA / 볼린저밴드 / ATR 단일 커널 계산 (증분 ATR이 있으면 ATR 생략)
+            sma_values, bb_upper, bb_middle, bb_lower, atr = _fused_last_indicators(
+                close,
+                high,
+                low,
+                _SMA_PERIODS,
+                cfg.BB_PERIOD,
+                float(cfg.BB_STD_DEV),
+                cfg.ATR_PERIOD if incremental_atr is None else 0,
+            )
+            if incremental_atr is not None:
+                atr = incremental_atr
+
             # 1. 이동평균선 (SMA)
-            indicators["moving_averages"] = self._calculate_moving_averages(
-                df, data_length
+            indicators["moving_averages"] = self._guard_category(
+                "moving_averages",
+                self._calculate_moving_averages,
+                sma_values,
+                current_price,
             )
 
             # 2. 모멘텀 지표 (RSI, MACD)
-            indicators["momentum_indicators"] = self._calculate_momentum_indicators(
-                df, data_length
+            indicators["momentum_indicators"] = self._guard_category(
+                "momentum_indicators",
+                self._calculate_momentum_indicators,
+                close,
+                data_length,
+                recurrences,
             )
 
             # 3. 변동성 지표 (볼린저밴드, ATR)
-            indicators["volatility_indicators"] = self._calculate_volatility_indicators(
-                df, data_length
+            indicators["volatility_indicators"] = self._guard_category(
+                "volatility_indicators",
+                self._calculate_volatility_indicators,
+                (bb_upper, bb_middle, bb_lower),
+                atr,
+                current_price,
             )
 
             # 4. 볼륨 지표 (OBV)
-            indicators["volume_indicators"] = self._calculate_volume_indicators(
-                df, data_length
+            indicators["volume_indicators"] = self._guard_category(
+                "volume_indicators",
+                self._calculate_volume_indicators,
+                close,
+                volume,
+                data_length,
             )
 
-            # 계산된 지표 로깅
+            return indicators
+
+        except Exception as e:
+            logger.error(f"❌ 보조지표 계산 실패: {e}")
+            return {}
+
+    async def warmup(self, symbol: str) -> bool:
+        """심볼의 평활 상태를 미리 계산 (첫 분석 주기 전 호출용)"""
+        df = await self.fetch_ohlcv_data(
+            symbol, "days", TechnicalIndicatorConfig.DATA_COLLECTION["daily_candles"]
+        )
+        if df is None or df.empty:
+            return False
+        close, high, low, _ = self._extract_arrays(df)
+        return bool(self._recurrence_values(symbol, df, close, high, low))
+
+    def _recurrence_values(
+        self,
+        symbol: Optional[str],
+        df: pd.DataFrame,
+        close: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+    ) -> Optional[Dict[str, Any]]:
+        """RSI/MACD/ATR 마지막 값 (확정 봉 상태 재사용, 마지막 봉만 반영)
+
+        같은 조회 창(첫 봉/직전 봉/길이 동일)이면 진행 중인 마지막 봉만 바뀌므로
+        저장된 상태에서 한 스텝만 진행. 창이 이동했으면 확정 봉 구간으로 재계산
+        """
+        if symbol is None or len(close) < 2:
+            return None
+
+        timestamps = df["datetime"].to_numpy().astype("datetime64[ns]")
+        prefix_key = (timestamps[0], timestamps[-2], len(close))
+
+        entry = self._indicator_state.get(symbol)
+        if entry is None or entry["key"] != prefix_key:
+            entry = {
+                "key": prefix_key,
+                "state": _recurrence_state(close[:-1], high[:-1], low[:-1]),
+            }
+            self._indicator_state[symbol] = entry
+
+        return _advance_recurrences(
+            entry["state"], close[-2], close[-1], high[-1], low[-1]
+        )
+
+    @staticmethod
+    def _extract_arrays(
+        df: pd.DataFrame,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """컬럼별 ndarray를 한 번만 추출 (close, high, low, volume)"""
+        return (
+            df["close"].to_numpy(np.float64),
+            df["high"].to_numpy(np.float64),
+            df["low"].to_numpy(np.float64),
+            df["volume"].to_numpy(np.float64),
+        )
+
+    @staticmethod
+    def _indicator_cache_key(df: pd.DataFrame, symbol: Optional[str]) -> Tuple:
+        """최신 캔들 기준 캐시 키"""
+        last = df.iloc[-1]
+        return (
+            symbol,
+            pd.Timestamp(last["datetime"]).value,
+            len(df),
+            float(last["close"]),
+            float(last["volume"]),
+        )
+
+    def _get_cached_indicators(self, cache_key: Tuple) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (적중 시 LRU 갱신 후 복사본 반환)"""
+        cached = self._ind_cache.get(cache_key)
+        if cached is None:
+            return None
+        self._ind_cache.move_to_end(cache_key)
+        logger.info("♻️ 캔들 변경 없음 - 캐시된 보조지표 사용")
+        return copy.deepcopy(cached)
+
+    def _store_indicators(self, cache_key: Tuple, indicators: Dict[str, Any]) -> None:
+        """계산 결과 로깅 및 캐시 저장"""
+        if not indicators:
+            return
+
+        # 계산된 지표 로깅 (로그 레벨이 꺼져 있으면 집계/포맷팅 생략)
+        if logger.isEnabledFor(logging.INFO):
             total_indicators = sum(len(category) for category in indicators.values())
             logger.info(f"📊 계산된 지표: {total_indicators}개")
 
-            # 지표별 상세 로깅
+        # 지표별 상세 로깅 (진단용)
+        if logger.isEnabledFor(logging.DEBUG):
             for category, values in indicators.items():
                 if values:
-                    logger.info(f"  📈 {category}: {list(values.keys())}")
+                    logger.debug(f"  📈 {category}: {list(values.keys())}")
 
-            return indicators
+        self._ind_cache[cache_key] = copy.deepcopy(indicators)
+        cache_size = TechnicalIndicatorConfig.DATA_COLLECTION["indicator_cache_size"]
+        while len(self._ind_cache) > cache_size:
+            self._ind_cache.popitem(last=False)
 
+    def _guard_category(
+        self, name: str, func: Callable[..., Dict[str, Any]], *args: Any
+    ) -> Dict[str, Any]:
+        """지표 카테고리 단위 예외 격리 (하나가 실패해도 나머지는 유지)"""
+        try:
+            result: Dict[str, Any] = func(*args)
+            return result
         except Exception as e:
-            logger.error(f"❌ 보조지표 계산 실패: {e}")
+            logger.warning(f"⚠️ {name} 계산 실패: {e}")
             return {}
 
     def _calculate_moving_averages(
-        self, df: pd.DataFrame, data_length: int
+        self, sma_values: np.ndarray, current_price: float
     ) -> Dict[str, Any]:
-        """이동평균선 계산"""
+        """이동평균선 계산 (커널 결과 포맷팅)"""
+        cfg = TechnicalIndicatorConfig
         moving_averages = {}
 
-        for period in TechnicalIndicatorConfig.SMA_PERIODS:
-            if data_length >= period:
-                try:
-                    if TALIB_AVAILABLE:
-                        sma_values = talib.SMA(df["close"].values, timeperiod=period)
-                        current_sma = (
-                            sma_values[-1]
-                            if len(sma_values) > 0 and not np.isnan(sma_values[-1])
-                            else None
-                        )
-                    else:
-                        current_sma = df["close"].rolling(window=period).mean().iloc[-1]
-
-                    if current_sma is not None and not pd.isna(current_sma):
-                        current_price = df["close"].iloc[-1]
-                        trend = "up" if current_price > current_sma else "down"
-                        signal = "bullish" if current_price > current_sma else "bearish"
-
-                        moving_averages[f"sma_{period}"] = {
-                            "value": float(current_sma),
-                            "trend": trend,
-                            "signal": signal,
-                        }
+        for period, current_sma in zip(cfg.SMA_PERIODS, sma_values):
+            if not math.isnan(current_sma):
+                trend = "up" if current_price > current_sma else "down"
+                signal = "bullish" if current_price > current_sma else "bearish"
 
-                except Exception as e:
-                    logger.warning(f"⚠️ SMA {period} 계산 실패: {e}")
+                moving_averages[f"sma_{period}"] = {
+                    "value": float(current_sma),
+                    "trend": trend,
+                    "signal": signal,
+                }
 
         return moving_averages
 
     def _calculate_rsi(
-        self, df: pd.DataFrame, data_length: int
+        self, close: np.ndarray, data_length: int, current_rsi: Optional[float] = None
     ) -> Optional[Dict[str, Any]]:
-        """RSI 지표 계산"""
-        if data_length < TechnicalIndicatorConfig.MIN_DATA_FOR_INDICATORS["rsi"]:
+        """RSI 지표 계산 (증분 계산된 current_rsi가 있으면 그대로 사용)"""
+        cfg = TechnicalIndicatorConfig
+        if data_length < cfg.MIN_DATA_FOR_INDICATORS["rsi"]:
             return None
 
-        try:
+        if current_rsi is None:
             if TALIB_AVAILABLE:
-                rsi_values = talib.RSI(
-                    df["close"].values, timeperiod=TechnicalIndicatorConfig.RSI_PERIOD
-                )
-                current_rsi = (
-                    rsi_values[-1]
-                    if len(rsi_values) > 0 and not np.isnan(rsi_values[-1])
-                    else None
-                )
+                # Wilder 평활은 전체 이력에 의존하므로 stream API 대신 전체 계산
+                current_rsi = talib.RSI(close, timeperiod=cfg.RSI_PERIOD)[-1]
             else:
-                delta = df["close"].diff()
-                gain = (
-                    (delta.where(delta > 0, 0))
-                    .rolling(window=TechnicalIndicatorConfig.RSI_PERIOD)
-                    .mean()
-                )
-                loss = (
-                    (-delta.where(delta < 0, 0))
-                    .rolling(window=TechnicalIndicatorConfig.RSI_PERIOD)
-                    .mean()
-                )
-                rs = gain / loss
-                rsi = 100 - (100 / (1 + rs))
-                current_rsi = rsi.iloc[-1] if not pd.isna(rsi.iloc[-1]) else None
-
-            if current_rsi is not None and not pd.isna(current_rsi):
-                # 신호 분류
-                if current_rsi >= TechnicalIndicatorConfig.RSI_OVERBOUGHT:
-                    rsi_signal = "overbought"
-                elif current_rsi <= TechnicalIndicatorConfig.RSI_OVERSOLD:
-                    rsi_signal = "oversold"
-                else:
-                    rsi_signal = "neutral"
-
-                # 강도 계산 (중립점에서 얼마나 멀리 있는지)
-                strength = (
-                    abs(current_rsi - TechnicalIndicatorConfig.RSI_NEUTRAL)
-                    / TechnicalIndicatorConfig.RSI_NEUTRAL
-                )
+                current_rsi = _rsi_wilder_last(close, cfg.RSI_PERIOD)
+
+        if not math.isnan(current_rsi):
+            # 신호 분류
+            if current_rsi >= cfg.RSI_OVERBOUGHT:
+                rsi_signal = "overbought"
+            elif current_rsi <= cfg.RSI_OVERSOLD:
+                rsi_signal = "oversold"
+            else:
+                rsi_signal = "neutral"
 
-                return {
-                    "value": float(current_rsi),
-                    "signal": rsi_signal,
-                    "strength": float(strength),
-                }
+            # 강도 계산 (중립점에서 얼마나 멀리 있는지)
+            strength = abs(current_rsi - cfg.RSI_NEUTRAL) / cfg.RSI_NEUTRAL
 
-            return None
+            return {
+                "value": float(current_rsi),
+                "signal": rsi_signal,
+                "strength": float(strength),
+            }
 
-        except Exception as e:
-            logger.warning(f"⚠️ RSI 계산 실패: {e}")
-            return None
+        return None
 
     def _calculate_macd(
-        self, df: pd.DataFrame, data_length: int
+        self,
+        close: np.ndarray,
+        data_length: int,
+        current: Optional[Tuple[float, float, float]] = None,
     ) -> Optional[Dict[str, Any]]:
-        """MACD 지표 계산"""
-        if data_length < TechnicalIndicatorConfig.MIN_DATA_FOR_INDICATORS["macd"]:
+        """MACD 지표 계산 (증분 계산된 (MACD, 시그널, 히스토그램)이 있으면 사용)"""
+        cfg = TechnicalIndicatorConfig
+        if data_length < cfg.MIN_DATA_FOR_INDICATORS["macd"]:
             return None
 
-        try:
-            if TALIB_AVAILABLE:
-                macd_line, macd_signal, macd_histogram = talib.MACD(
-                    df["close"].values,
-                    fastperiod=TechnicalIndicatorConfig.MACD_FAST_PERIOD,
-                    slowperiod=TechnicalIndicatorConfig.MACD_SLOW_PERIOD,
-                    signalperiod=TechnicalIndicatorConfig.MACD_SIGNAL_PERIOD,
-                )
-                current_macd = (
-                    macd_line[-1]
-                    if len(macd_line) > 0 and not np.isnan(macd_line[-1])
-                    else None
-                )
-                current_signal = (
-                    macd_signal[-1]
-                    if len(macd_signal) > 0 and not np.isnan(macd_signal[-1])
-                    else None
-                )
-                current_histogram = (
-                    macd_histogram[-1]
-                    if len(macd_histogram) > 0 and not np.isnan(macd_histogram[-1])
-                    else None
-                )
-            else:
-                ema_fast = (
-                    df["close"]
-                    .ewm(span=TechnicalIndicatorConfig.MACD_FAST_PERIOD)
-                    .mean()
-                )
-                ema_slow = (
-                    df["close"]
-                    .ewm(span=TechnicalIndicatorConfig.MACD_SLOW_PERIOD)
-                    .mean()
-                )
-                macd = ema_fast - ema_slow
-                signal = macd.ewm(
-                    span=TechnicalIndicatorConfig.MACD_SIGNAL_PERIOD
-                ).mean()
-                histogram = macd - signal
-
-                current_macd = macd.iloc[-1]
-                current_signal = signal.iloc[-1]
-                current_histogram = histogram.iloc[-1]
-
-            if all(
-                x is not None and not pd.isna(x)
-                for x in [current_macd, current_signal, current_histogram]
-            ):
-                macd_signal_direction = (
-                    "bullish" if current_macd > current_signal else "bearish"
-                )
+        if current is not None:
+            current_macd, current_signal, current_histogram = current
+        elif TALIB_AVAILABLE:
+            # EMA 역시 전체 이력에 의존하므로 stream API 대신 전체 계산
+            macd_line, macd_signal, macd_histogram = talib.MACD(
+                close,
+                fastperiod=cfg.MACD_FAST_PERIOD,
+                slowperiod=cfg.MACD_SLOW_PERIOD,
+                signalperiod=cfg.MACD_SIGNAL_PERIOD,
+            )
+            current_macd = macd_line[-1]
+            current_signal = macd_signal[-1]
+            current_histogram = macd_histogram[-1]
+        else:
+            current_macd, current_signal, current_histogram = _macd_last(
+                close,
+                cfg.MACD_FAST_PERIOD,
+                cfg.MACD_SLOW_PERIOD,
+                cfg.MACD_SIGNAL_PERIOD,
+            )
 
-                # 크로스오버 감지 (임계값 사용)
-                crossover = (
-                    1
-                    if abs(current_macd - current_signal)
-                    < abs(current_histogram)
-                    * TechnicalIndicatorConfig.MACD_CROSSOVER_THRESHOLD
-                    else 0
-                )
+        if not any(
+            math.isnan(x) for x in (current_macd, current_signal, current_histogram)
+        ):
+            macd_signal_direction = (
+                "bullish" if current_macd > current_signal else "bearish"
+            )
 
-                return {
-                    "macd_line": float(current_macd),
-                    "signal_line": float(current_signal),
-                    "histogram": float(current_histogram),
-                    "signal": macd_signal_direction,
-                    "crossover": crossover,
-                }
+            # 크로스오버 감지 (임계값 사용)
+            crossover = (
+                1
+                if abs(current_macd - current_signal)
+                < abs(current_histogram) * cfg.MACD_CROSSOVER_THRESHOLD
+                else 0
+            )
 
-            return None
+            return {
+                "macd_line": float(current_macd),
+                "signal_line": float(current_signal),
+                "histogram": float(current_histogram),
+                "signal": macd_signal_direction,
+                "crossover": crossover,
+            }
 
-        except Exception as e:
-            logger.warning(f"⚠️ MACD 계산 실패: {e}")
-            return None
+        return None
 
     def _calculate_bollinger_bands(
-        self, df: pd.DataFrame, data_length: int
+        self, bands: Tuple[float, float, float], current_price: float
     ) -> Optional[Dict[str, Any]]:
-        """볼린저 밴드 지표 계산"""
-        if (
-            data_length
-            < TechnicalIndicatorConfig.MIN_DATA_FOR_INDICATORS["bollinger_bands"]
-        ):
+        """볼린저 밴드 지표 계산 (커널 결과 포맷팅)"""
+        cfg = TechnicalIndicatorConfig
+        current_upper, current_middle, current_lower = bands
+        if any(math.isnan(x) for x in bands):
             return None
 
-        try:
-            if TALIB_AVAILABLE:
-                upper, middle, lower = talib.BBANDS(
-                    df["close"].values,
-                    timeperiod=TechnicalIndicatorConfig.BB_PERIOD,
-                    nbdevup=TechnicalIndicatorConfig.BB_STD_DEV,
-                    nbdevdn=TechnicalIndicatorConfig.BB_STD_DEV,
-                )
-                current_upper = (
-                    upper[-1] if len(upper) > 0 and not np.isnan(upper[-1]) else None
-                )
-                current_middle = (
-                    middle[-1] if len(middle) > 0 and not np.isnan(middle[-1]) else None
-                )
-                current_lower = (
-                    lower[-1] if len(lower) > 0 and not np.isnan(lower[-1]) else None
-                )
-            else:
-                sma = (
-                    df["close"]
-                    .rolling(window=TechnicalIndicatorConfig.BB_PERIOD)
-                    .mean()
-                )
-                std = (
-                    df["close"].rolling(window=TechnicalIndicatorConfig.BB_PERIOD).std()
-                )
-                current_upper = (
-                    sma + (std * TechnicalIndicatorConfig.BB_STD_DEV)
-                ).iloc[-1]
-                current_middle = sma.iloc[-1]
-                current_lower = (
-                    sma - (std * TechnicalIndicatorConfig.BB_STD_DEV)
-                ).iloc[-1]
-
-            if all(
-                x is not None and not pd.isna(x)
-                for x in [current_upper, current_middle, current_lower]
-            ):
-                current_price = df["close"].iloc[-1]
-                width = current_upper - current_lower
-
-                # 가격 위치 판단
-                if current_price > current_upper:
-                    position = "upper"
-                elif current_price < current_lower:
-                    position = "lower"
-                else:
-                    position = "middle"
-
-                # 스퀴즈 감지 (밴드 폭이 중간값 대비 임계값보다 작을 때)
-                squeeze = (
-                    1
-                    if width
-                    < current_middle * TechnicalIndicatorConfig.BB_SQUEEZE_THRESHOLD
-                    else 0
-                )
+        width = current_upper - current_lower
 
-                return {
-                    "upper": float(current_upper),
-                    "middle": float(current_middle),
-                    "lower": float(current_lower),
-                    "width": float(width),
-                    "position": position,
-                    "squeeze": squeeze,
-                }
+        # 가격 위치 판단
+        if current_price > current_upper:
+            position = "upper"
+        elif current_price < current_lower:
+            position = "lower"
+        else:
+            position = "middle"
 
-            return None
+        # 스퀴즈 감지 (밴드 폭이 중간값 대비 임계값보다 작을 때)
+        squeeze = 1 if width < current_middle * cfg.BB_SQUEEZE_THRESHOLD else 0
 
-        except Exception as e:
-            logger.warning(f"⚠️ 볼린저밴드 계산 실패: {e}")
-            return None
+        return {
+            "upper": float(current_upper),
+            "middle": float(current_middle),
+            "lower": float(current_lower),
+            "width": float(width),
+            "position": position,
+            "squeeze": squeeze,
+        }
 
     def _calculate_atr(
-        self, df: pd.DataFrame, data_length: int
+        self, current_atr: float, current_price: float
     ) -> Optional[Dict[str, Any]]:
-        """ATR 지표 계산"""
-        if data_length < TechnicalIndicatorConfig.MIN_DATA_FOR_INDICATORS["atr"]:
+        """ATR 지표 계산 (커널 결과 포맷팅)"""
+        cfg = TechnicalIndicatorConfig
+        if math.isnan(current_atr) or current_atr <= 0:
             return None
 
-        try:
-            if TALIB_AVAILABLE:
-                atr_values = talib.ATR(
-                    df["high"].values,
-                    df["low"].values,
-                    df["close"].values,
-                    timeperiod=TechnicalIndicatorConfig.ATR_PERIOD,
-                )
-                current_atr = (
-                    atr_values[-1]
-                    if len(atr_values) > 0 and not np.isnan(atr_values[-1])
-                    else None
-                )
-            else:
-                high_low = df["high"] - df["low"]
-                high_close = np.abs(df["high"] - df["close"].shift())
-                low_close = np.abs(df["low"] - df["close"].shift())
-                true_range = pd.concat([high_low, high_close, low_close], axis=1).max(
-                    axis=1
-                )
-                current_atr = (
-                    true_range.rolling(window=TechnicalIndicatorConfig.ATR_PERIOD)
-                    .mean()
-                    .iloc[-1]
-                )
-
-            if current_atr is not None and not pd.isna(current_atr) and current_atr > 0:
-                current_price = df["close"].iloc[-1]
-                atr_percentage = current_atr / current_price
-
-                # 변동성 수준 분류
-                if atr_percentage > TechnicalIndicatorConfig.ATR_HIGH_VOLATILITY:
-                    volatility_level = "high"
-                elif atr_percentage > TechnicalIndicatorConfig.ATR_MEDIUM_VOLATILITY:
-                    volatility_level = "medium"
-                else:
-                    volatility_level = "low"
-
-                return {
-                    "value": float(current_atr),
-                    "volatility_level": volatility_level,
-                    "percentage": float(atr_percentage * 100),  # 백분율로 저장
-                }
+        atr_percentage = current_atr / current_price
 
-            return None
+        # 변동성 수준 분류
+        if atr_percentage > cfg.ATR_HIGH_VOLATILITY:
+            volatility_level = "high"
+        elif atr_percentage > cfg.ATR_MEDIUM_VOLATILITY:
+            volatility_level = "medium"
+        else:
+            volatility_level = "low"
 
-        except Exception as e:
-            logger.warning(f"⚠️ ATR 계산 실패: {e}")
-            return None
+        return {
+            "value": float(current_atr),
+            "volatility_level": volatility_level,
+            "percentage": float(atr_percentage * 100),  # 백분율로 저장
+        }
 
     def _calculate_obv(
-        self, df: pd.DataFrame, data_length: int
+        self, close: np.ndarray, volume: np.ndarray, data_length: int
     ) -> Optional[Dict[str, Any]]:
         """OBV 지표 계산"""
-        if data_length < TechnicalIndicatorConfig.MIN_DATA_FOR_INDICATORS["obv"]:
+        cfg = TechnicalIndicatorConfig
+        if data_length < cfg.MIN_DATA_FOR_INDICATORS["obv"]:
             return None
 
-        try:
-            if TALIB_AVAILABLE:
-                # TA-Lib OBV 사용
-                obv_values = talib.OBV(df["close"].values, df["volume"].values)
-                current_obv = (
-                    obv_values[-1]
-                    if len(obv_values) > 0 and not np.isnan(obv_values[-1])
-                    else None
+        if TALIB_AVAILABLE:
+            # TA-Lib OBV 사용
+            obv_values = talib.OBV(close, volume)
+        else:
+            # 수동 OBV 계산: 첫 거래량에서 시작해 가격 방향(+1/0/-1)별 누적
+            obv_values = np.empty_like(volume)
+            obv_values[0] = volume[0]
+            obv_values[1:] = volume[0] + np.cumsum(np.sign(np.diff(close)) * volume[1:])
+
+        current_obv = obv_values[-1]
+
+        if not math.isnan(current_obv):
+            # OBV 추세 분석 (최소 추세 분석 기간 필요)
+            if data_length >= cfg.OBV_TREND_PERIOD:
+                recent_obv = obv_values[-cfg.OBV_TREND_PERIOD :]
+
+                # 추세 계산 (선형 회귀 기울기 = Σ(x - x̄)·y / Sxx)
+                slope = (
+                    float(cfg.OBV_TREND_WEIGHTS @ recent_obv) / cfg.OBV_TREND_SXX
+                    if cfg.OBV_TREND_SXX > 0
+                    else 0
                 )
-            else:
-                # 수동 OBV 계산
-                obv = [df["volume"].iloc[0]]  # 첫 번째 값으로 초기화
-
-                for i in range(1, len(df)):
-                    if df["close"].iloc[i] > df["close"].iloc[i - 1]:
-                        # 상승: 거래량 더하기
-                        obv.append(obv[-1] + df["volume"].iloc[i])
-                    elif df["close"].iloc[i] < df["close"].iloc[i - 1]:
-                        # 하락: 거래량 빼기
-                        obv.append(obv[-1] - df["volume"].iloc[i])
-                    else:
-                        # 변화없음: 그대로 유지
-                        obv.append(obv[-1])
-
-                current_obv = obv[-1] if obv else None
-
-            if current_obv is not None and not pd.isna(current_obv):
-                # OBV 추세 분석 (최소 추세 분석 기간 필요)
-                if len(df) >= TechnicalIndicatorConfig.OBV_TREND_PERIOD:
-                    if TALIB_AVAILABLE:
-                        recent_obv = obv_values[
-                            -TechnicalIndicatorConfig.OBV_TREND_PERIOD :
-                        ]
-                    else:
-                        recent_obv = obv[-TechnicalIndicatorConfig.OBV_TREND_PERIOD :]
-
-                    # 추세 계산 (선형 회귀 기울기)
-                    x = np.arange(len(recent_obv))
-                    slope = (
-                        np.polyfit(x, recent_obv, 1)[0] if len(recent_obv) > 1 else 0
-                    )
-
-                    # 신호 생성
-                    if slope > 0:
-                        obv_signal = "bullish"  # 상승 추세
-                        obv_trend = "up"
-                    elif slope < 0:
-                        obv_signal = "bearish"  # 하락 추세
-                        obv_trend = "down"
-                    else:
-                        obv_signal = "neutral"  # 중립
-                        obv_trend = "sideways"
 
-                    # 추세 강도 계산 (기울기 절댓값 정규화)
-                    max_volume = df["volume"].max()
-                    trend_strength = (
-                        min(abs(slope) / max_volume * 100, 100) if max_volume > 0 else 0
-                    )
+                # 신호 생성
+                if slope > 0:
+                    obv_signal = "bullish"  # 상승 추세
+                    obv_trend = "up"
+                elif slope < 0:
+                    obv_signal = "bearish"  # 하락 추세
+                    obv_trend = "down"
                 else:
-                    obv_signal = "neutral"
+                    obv_signal = "neutral"  # 중립
                     obv_trend = "sideways"
-                    trend_strength = 0
 
-                return {
-                    "value": float(current_obv),
-                    "signal": obv_signal,
-                    "trend": obv_trend,
-                    "trend_strength": float(trend_strength),
-                }
+                # 추세 강도 계산 (기울기 절댓값 정규화)
+                max_volume = volume.max()
+                trend_strength = (
+                    min(abs(slope) / max_volume * 100, 100) if max_volume > 0 else 0
+                )
+            else:
+                obv_signal = "neutral"
+                obv_trend = "sideways"
+                trend_strength = 0
 
-            return None
+            return {
+                "value": float(current_obv),
+                "signal": obv_signal,
+                "trend": obv_trend,
+                "trend_strength": float(trend_strength),
+            }
 
-        except Exception as e:
-            logger.warning(f"⚠️ OBV 계산 실패: {e}")
-            return None
+        return None
 
     def _calculate_momentum_indicators(
-        self, df: pd.DataFrame, data_length: int
+        self,
+        close: np.ndarray,
+        data_length: int,
+        recurrences: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """모멘텀 지표 계산 (RSI, MACD)"""
         momentum_indicators = {}
+        recurrences = recurrences or {}
 
         # RSI 계산
-        rsi_result = self._calculate_rsi(df, data_length)
+        rsi_result = self._calculate_rsi(close, data_length, recurrences.get("rsi"))
         if rsi_result:
             momentum_indicators["rsi"] = rsi_result
 
         # MACD 계산
-        macd_result = self._calculate_macd(df, data_length)
+        macd_result = self._calculate_macd(close, data_length, recurrences.get("macd"))
         if macd_result:
             momentum_indicators["macd"] = macd_result
 
         return momentum_indicators
 
     def _calculate_volatility_indicators(
-        self, df: pd.DataFrame, data_length: int
+        self,
+        bollinger_bands: Tuple[float, float, float],
+        atr: float,
+        current_price: float,
     ) -> Dict[str, Any]:
         """변동성 지표 계산 (볼린저밴드, ATR)"""
         volatility_indicators = {}
 
         # 볼린저 밴드 계산
-        bb_result = self._calculate_bollinger_bands(df, data_length)
+        bb_result = self._calculate_bollinger_bands(bollinger_bands, current_price)
         if bb_result:
             volatility_indicators["bollinger_bands"] = bb_result
 
         # ATR 계산
-        atr_result = self._calculate_atr(df, data_length)
+        atr_result = self._calculate_atr(atr, current_price)
         if atr_result:
             volatility_indicators["atr"] = atr_result
 
         return volatility_indicators
 
     def _calculate_volume_indicators(
-        self, df: pd.DataFrame, data_length: int
+        self, close: np.ndarray, volume: np.ndarray, data_length: int
     ) -> Dict[str, Any]:
         """볼륨 지표 계산 (OBV)"""
         volume_indicators = {}
 
         # OBV 계산
-        obv_result = self._calculate_obv(df, data_length)
+        obv_result = self._calculate_obv(close, volume, data_length)
         if obv_result:
             volume_indicators["obv"] = obv_result
 
@@ -746,160 +1158,212 @@ class UpbitTechnicalAnalyzer:
 
     def create_ohlcv_points(
         self, df: pd.DataFrame, symbol: str, timeframe: str
-    ) -> List[Point]:
-        """OHLCV 데이터를 InfluxDB Points로 변환"""
-        points = []
+    ) -> List[str]:
+        """OHLCV 데이터를 InfluxDB Line Protocol 문자열로 변환
+
+        Point 빌더를 거치지 않고 컬럼 배열에서 바로 한 줄씩 생성.
+        값이 NaN/inf인 캔들은 제외 (Line Protocol에서 표현 불가)
+        """
+        lines = []
 
         try:
-            records = df.to_dict("records")
-
-            for record in records:
-                point = (
-                    Point("ohlcv_data")
-                    .tag("symbol", symbol)
-                    .tag("timeframe", timeframe)
-                    .field("open", float(record["open"]))
-                    .field("high", float(record["high"]))
-                    .field("low", float(record["low"]))
-                    .field("close", float(record["close"]))
-                    .field("volume", float(record["volume"]))
-                    .field("volume_krw", float(record["volume_krw"]))
-                    .time(record["datetime"])
+            values = df[
+                ["open", "high", "low", "close", "volume", "volume_krw"]
+            ].to_numpy(np.float64)
+            timestamps = (
+                df["datetime"].to_numpy().astype("datetime64[ns]").astype(np.int64)
+            )
+            finite = np.isfinite(values).all(axis=1)
+
+            prefix = f"ohlcv_data,symbol={symbol},timeframe={timeframe} "
+            lines = [
+                f"{prefix}open={o},high={h},low={lo},close={c},"
+                f"volume={v},volume_krw={v_krw} {ts}"
+                for (o, h, lo, c, v, v_krw), ts in zip(
+                    values[finite].tolist(), timestamps[finite].tolist()
                 )
-
-                points.append(point)
+            ]
 
         except Exception as e:
-            logger.error(f"❌ OHLCV Point 생성 실패: {e}")
+            logger.error(f"❌ OHLCV Line Protocol 생성 실패: {e}")
 
-        return points
+        return lines
 
     def create_indicator_points(
-        self, indicators: Dict[str, Any], symbol: str
+        self, indicators: Dict[str, Any], symbol: str, timestamp: int
     ) -> List[Point]:
-        """보조지표를 InfluxDB Points로 변환"""
+        """보조지표를 InfluxDB Points로 변환
+
+        값 범위가 제한된 문자열(signal/trend/position/volatility_level)은 인덱싱되는
+        태그로 저장한다. 기존 데이터에 같은 이름의 문자열 필드가 있으므로 태그 키는
+        `_tag` 접미사로 구분한다 (signal_tag, trend_tag, position_tag,
+        volatility_level_tag). crossover/squeeze는 기존 스키마와 같은 정수 필드
+        (0/1)로 유지한다 (InfluxDB는 샤드 내 필드 타입 변경을 거부함).
+
+        Args:
+            timestamp: 분석 시점 (epoch 나노초). 같은 틱의 심볼들은 동일한 값을 공유
+        """
         points = []
-        timestamp = datetime.now(timezone.utc)
+        base_tags = {"symbol": symbol, "timeframe": "1d"}
+
+        def make_point(
+            indicator_type: str,
+            indicator_name: str,
+            fields: Dict[str, Any],
+            tags: Optional[Dict[str, str]] = None,
+        ) -> Point:
+            # 공통 태그를 재사용해 태그/필드/시간을 한 번에 구성
+            point: Point = Point.from_dict(
+                {
+                    "measurement": "technical_indicators",
+                    "tags": {
+                        **base_tags,
+                        "indicator_type": indicator_type,
+                        "indicator_name": indicator_name,
+                        **(tags or {}),
+                    },
+                    "fields": fields,
+                    "time": timestamp,
+                },
+                WritePrecision.NS,  # type: ignore[arg-type]
+            )
+            return point
 
         try:
             # SMA 지표
             for sma_name, sma_data in indicators.get("moving_averages", {}).items():
-                point = (
-                    Point("technical_indicators")
-                    .tag("symbol", symbol)
-                    .tag("timeframe", "1d")
-                    .tag("indicator_type", "sma")
-                    .tag("indicator_name", sma_name)
-                    .field("value", sma_data["value"])
-                    .field("trend", sma_data["trend"])
-                    .field("signal", sma_data["signal"])
-                    .time(timestamp)
+                points.append(
+                    make_point(
+                        "sma",
+                        sma_name,
+                        {"value": sma_data["value"]},
+                        {
+                            "trend_tag": sma_data["trend"],
+                            "signal_tag": sma_data["signal"],
+                        },
+                    )
                 )
-                points.append(point)
 
             # RSI
             rsi_data = indicators.get("momentum_indicators", {}).get("rsi", {})
             if rsi_data:
-                point = (
-                    Point("technical_indicators")
-                    .tag("symbol", symbol)
-                    .tag("timeframe", "1d")
-                    .tag("indicator_type", "rsi")
-                    .tag("indicator_name", "rsi")
-                    .field("value", rsi_data["value"])
-                    .field("signal", rsi_data["signal"])
-                    .field("strength", rsi_data["strength"])
-                    .time(timestamp)
+                points.append(
+                    make_point(
+                        "rsi",
+                        "rsi",
+                        {
+                            "value": rsi_data["value"],
+                            "strength": rsi_data["strength"],
+                        },
+                        {"signal_tag": rsi_data["signal"]},
+                    )
                 )
-                points.append(point)
 
             # MACD
             macd_data = indicators.get("momentum_indicators", {}).get("macd", {})
             if macd_data:
-                point = (
-                    Point("technical_indicators")
-                    .tag("symbol", symbol)
-                    .tag("timeframe", "1d")
-                    .tag("indicator_type", "macd")
-                    .tag("indicator_name", "macd")
-                    .field("value", macd_data["macd_line"])
-                    .field("value_secondary", macd_data["signal_line"])
-                    .field("value_tertiary", macd_data["histogram"])
-                    .field("signal", macd_data["signal"])
-                    .field("crossover", macd_data["crossover"])
-                    .time(timestamp)
+                points.append(
+                    make_point(
+                        "macd",
+                        "macd",
+                        {
+                            "value": macd_data["macd_line"],
+                            "value_secondary": macd_data["signal_line"],
+                            "value_tertiary": macd_data["histogram"],
+                            "crossover": macd_data["crossover"],
+                        },
+                        {"signal_tag": macd_data["signal"]},
+                    )
                 )
-                points.append(point)
 
             # 볼린저 밴드
             bb_data = indicators.get("volatility_indicators", {}).get(
                 "bollinger_bands", {}
             )
             if bb_data:
-                point = (
-                    Point("technical_indicators")
-                    .tag("symbol", symbol)
-                    .tag("timeframe", "1d")
-                    .tag("indicator_type", "bollinger_bands")
-                    .tag("indicator_name", "bb")
-                    .field("value", bb_data["middle"])
-                    .field("value_secondary", bb_data["upper"])
-                    .field("value_tertiary", bb_data["lower"])
-                    .field("width", bb_data["width"])
-                    .field("position", bb_data["position"])
-                    .field("squeeze", bb_data["squeeze"])
-                    .time(timestamp)
+                points.append(
+                    make_point(
+                        "bollinger_bands",
+                        "bb",
+                        {
+                            "value": bb_data["middle"],
+                            "value_secondary": bb_data["upper"],
+                            "value_tertiary": bb_data["lower"],
+                            "width": bb_data["width"],
+                            "squeeze": bb_data["squeeze"],
+                        },
+                        {"position_tag": bb_data["position"]},
+                    )
                 )
-                points.append(point)
 
             # ATR
             atr_data = indicators.get("volatility_indicators", {}).get("atr", {})
             if atr_data:
-                point = (
-                    Point("technical_indicators")
-                    .tag("symbol", symbol)
-                    .tag("timeframe", "1d")
-                    .tag("indicator_type", "atr")
-                    .tag("indicator_name", "atr")
-                    .field("value", atr_data["value"])
-                    .field("volatility_level", atr_data["volatility_level"])
-                    .field("percentage", atr_data["percentage"])
-                    .time(timestamp)
+                points.append(
+                    make_point(
+                        "atr",
+                        "atr",
+                        {
+                            "value": atr_data["value"],
+                            "percentage": atr_data["percentage"],
+                        },
+                        {"volatility_level_tag": atr_data["volatility_level"]},
+                    )
                 )
-                points.append(point)
 
             # OBV (새로 추가!)
             obv_data = indicators.get("volume_indicators", {}).get("obv", {})
             if obv_data:
-                point = (
-                    Point("technical_indicators")
-                    .tag("symbol", symbol)
-                    .tag("timeframe", "1d")
-                    .tag("indicator_type", "obv")
-                    .tag("indicator_name", "obv")
-                    .field("value", obv_data["value"])
-                    .field("signal", obv_data["signal"])
-                    .field("trend", obv_data["trend"])
-                    .field("trend_strength", obv_data["trend_strength"])
-                    .time(timestamp)
+                points.append(
+                    make_point(
+                        "obv",
+                        "obv",
+                        {
+                            "value": obv_data["value"],
+                            "trend_strength": obv_data["trend_strength"],
+                        },
+                        {
+                            "signal_tag": obv_data["signal"],
+                            "trend_tag": obv_data["trend"],
+                        },
+                    )
                 )
-                points.append(point)
 
         except Exception as e:
             logger.error(f"❌ 보조지표 Point 생성 실패: {e}")
 
         return points
 
-    def save_to_influxdb(self, points: List[Point]) -> bool:
-        """InfluxDB에 Points 저장"""
+    def save_to_influxdb(
+        self, points: List[Union[Point, str]], sync: bool = False
+    ) -> bool:
+        """InfluxDB에 Points 저장
+
+        기본은 배치 큐에 등록만 하고 전송은 백그라운드에서 수행하므로, True는
+        "등록 성공"일 뿐 저장 성공이 아니다 (전송 실패는 write_error_count로 집계).
+        전달한 리스트는 등록 후 수정하지 말 것 (호출마다 새 리스트 사용)
+
+        Args:
+            sync: True면 동기 WriteApi로 즉시 전송하고 실제 저장 결과를 반환
+        """
         if not points:
             return True
 
         try:
-            self.write_api.write(
+            if sync:
+                if self._sync_write_api is None:
+                    self._sync_write_api = self.influx_client.write_api(
+                        write_options=SYNCHRONOUS
+                    )
+                write_api = self._sync_write_api
+            else:
+                write_api = self.write_api
+
+            write_api.write(
                 bucket=self.influx_config.bucket,
                 org=self.influx_config.org,
                 record=points,
+                write_precision=WritePrecision.NS,
             )
             return True
 
@@ -911,25 +1375,29 @@ class UpbitTechnicalAnalyzer:
     # 통합 분석 실행 관련 메서드
     # ===========================================
 
-    async def analyze_symbol(self, symbol: str = "KRW-BTC") -> bool:
-        """심볼 분석 및 저장"""
+    async def _collect_symbol_points(
+        self, symbol: str, timestamp: int
+    ) -> List[Union[Point, str]]:
+        """심볼 분석 후 저장할 레코드 생성 (저장은 호출 측에서 일괄 수행)"""
         try:
             logger.info(f"🔄 {symbol} 기술분석 시작...")
             self.analysis_count += 1
 
             # 1. 시장 데이터 수집
-            daily_data = self.fetch_ohlcv_data(symbol, "days", 30)
-            hourly_data = self.fetch_ohlcv_data(symbol, "minutes/60", 24)
+            daily_data, hourly_data = await asyncio.gather(
+                self.fetch_ohlcv_data(symbol, "days", 30),
+                self.fetch_ohlcv_data(symbol, "minutes/60", 24),
+            )
 
             if daily_data is None:
                 logger.error(f"❌ {symbol} 일봉 데이터 수집 실패")
-                return False
+                return []
 
             # 2. 보조지표 계산
-            indicators = self.calculate_indicators(daily_data)
+            indicators = self.calculate_indicators(daily_data, symbol)
 
             # 3. InfluxDB Points 생성
-            all_points = []
+            all_points: List[Union[Point, str]] = []
 
             # OHLCV 데이터
             daily_points = self.create_ohlcv_points(daily_data, symbol, "1d")
@@ -943,49 +1411,116 @@ class UpbitTechnicalAnalyzer:
 
             # 보조지표 데이터
             if indicators:
-                indicator_points = self.create_indicator_points(indicators, symbol)
+                indicator_points = self.create_indicator_points(
+                    indicators, symbol, timestamp
+                )
                 all_points.extend(indicator_points)
                 self.indicators_write_count += len(indicator_points)
 
-            # 4. InfluxDB 저장
-            if all_points:
-                success = self.save_to_influxdb(all_points)
-                if success:
-                    logger.info(f"✅ {symbol} 분석 완료: {len(all_points)}건 저장")
-                    self.success_count += 1
-                    return True
-                else:
-                    logger.error(f"❌ {symbol} 저장 실패")
-                    return False
-            else:
+            if not all_points:
                 logger.warning(f"⚠️ {symbol} 저장할 데이터 없음")
-                return False
+
+            return all_points
 
         except Exception as e:
             logger.error(f"❌ {symbol} 기술분석 실패: {e}")
-            return False
+            return []
 
-    def print_analysis_statistics(self):
-        """분석 통계 출력"""
-        uptime = time.time() - self.start_time
-        success_rate = (self.success_count / max(self.analysis_count, 1)) * 100
-
-        print(
-            f"""
-┌─────────────────────────────────────────────────────────────────┐
-│ 📈 업비트 기술분석 통계                                         │
-├─────────────────────────────────────────────────────────────────┤
-│ 총 분석: {self.analysis_count}회                                │
-│ 성공: {self.success_count}회 ({success_rate:.1f}%)              │
-│ 가동시간: {uptime/60:.1f}분                                     │
-├─────────────────────────────────────────────────────────────────┤
-│ 💾 InfluxDB 저장:                                              │
-│   OHLCV: {self.ohlcv_write_count}건                            │
-│   보조지표: {self.indicators_write_count}건                     │
-└─────────────────────────────────────────────────────────────────┘
+    async def analyze_symbol(
+        self, symbol: str = "KRW-BTC", timestamp: Optional[int] = None
+    ) -> bool:
+        """심볼 분석 및 저장 (단발 호출용: 즉시 전송해 실제 저장 여부를 반환)
+
+        Args:
+            timestamp: 보조지표 타임스탬프 (epoch 나노초, 미지정 시 현재 시각)
+        """
+        return await self._run_analysis_cycle([symbol], timestamp, sync=True) == 1
+
+    def _settle_pending_writes(self) -> None:
+        """직전 틱 배치의 전송 결과 반영 (그 사이 저장 실패 콜백이 없었으면 성공)"""
+        if self._pending_symbols and self.write_error_count == self._pending_error_mark:
+            self.success_count += self._pending_symbols
+        self._pending_symbols = 0
+
+    async def _run_analysis_cycle(
+        self, symbols: List[str], timestamp: Optional[int] = None, sync: bool = False
+    ) -> int:
+        """스케줄러 1틱 분석: 전체 심볼의 Points를 모아 한 번의 write로 저장
+
+        Args:
+            sync: True면 즉시 전송 (기본은 배치 큐 등록, 성공 집계는 다음 틱에 확정)
+
+        Returns:
+            저장(sync=False면 배치 큐 등록)에 성공한 심볼 수
         """
+        if timestamp is None:
+            timestamp = time.time_ns()
+
+        # 직전 틱 배치는 이미 전송됐으므로 결과를 먼저 반영
+        self._settle_pending_writes()
+
+        # 심볼별 수집/계산을 동시에 진행 (업비트 요청 제한을 위해 동시 실행 수 제한)
+        semaphore = asyncio.Semaphore(
+            TechnicalIndicatorConfig.DATA_COLLECTION["max_concurrent_symbols"]
         )
 
+        async def collect(symbol: str) -> List[Union[Point, str]]:
+            async with semaphore:
+                return await self._collect_symbol_points(symbol, timestamp)
+
+        results = await asyncio.gather(*(collect(symbol) for symbol in symbols))
+
+        all_points = []
+        analyzed_symbols = []
+
+        for symbol, points in zip(symbols, results):
+            if points:
+                all_points.extend(points)
+                analyzed_symbols.append(symbol)
+
+        if not all_points:
+            return 0
+
+        # 틱당 HTTP 요청 1회 (심볼 수와 무관)
+        if sync:
+            # 동기 전송은 HTTP 응답까지 블로킹하므로 스레드에서 실행
+            success = await asyncio.to_thread(self.save_to_influxdb, all_points, True)
+        else:
+            # 배치 큐 등록은 블로킹 없이 즉시 반환
+            success = self.save_to_influxdb(all_points)
+        if not success:
+            logger.error(f"❌ {', '.join(analyzed_symbols)} 저장 실패")
+            return 0
+
+        if sync:
+            logger.info(
+                f"✅ {', '.join(analyzed_symbols)} 분석 완료: {len(all_points)}건 저장"
+            )
+            self.success_count += len(analyzed_symbols)
+        else:
+            logger.info(
+                f"✅ {', '.join(analyzed_symbols)} 분석 완료: "
+                f"{len(all_points)}건 저장 요청"
+            )
+            self._pending_symbols += len(analyzed_symbols)
+            self._pending_error_mark = self.write_error_count
+        return len(analyzed_symbols)
+
+    def print_analysis_statistics(self):
+        """분석 통계 출력 (로그 수집기가 파싱할 수 있도록 한 줄 JSON으로 기록)"""
+        stats = {
+            "analysis": self.analysis_count,
+            "success": self.success_count,
+            "success_rate": round(
+                self.success_count / max(self.analysis_count, 1) * 100, 1
+            ),
+            "uptime_s": round(time.time() - self.start_time),
+            "ohlcv_points": self.ohlcv_write_count,
+            "indicator_points": self.indicators_write_count,
+            "write_errors": self.write_error_count,
+        }
+        logger.info(f"📈 기술분석 통계 {json.dumps(stats)}", extra={"stats": stats})
+
     # ===========================================
     # 스케줄러 관련 메서드
     # ===========================================
@@ -996,17 +1531,26 @@ class UpbitTechnicalAnalyzer:
         """기술분석 스케줄러 시작"""
         logger.info(f"📈 기술분석 스케줄러 시작: {interval_minutes}분 간격")
 
+        interval = interval_minutes * 60
+        # 단조 시계 기준 다음 실행 시각 (분석 소요 시간만큼 주기가 밀리지 않도록)
+        next_run = time.monotonic()
+
         while True:
             try:
-                for symbol in symbols:
-                    await self.analyze_symbol(symbol)
+                # 틱 단위 타임스탬프 공유 + 일괄 저장
+                await self._run_analysis_cycle(symbols, time.time_ns())
 
                 # 통계 출력
                 self.print_analysis_statistics()
 
-                # 대기
-                logger.info(f"⏰ {interval_minutes}분 대기 중...")
-                await asyncio.sleep(interval_minutes * 60)
+                # 다음 실행 시각까지 대기 (분석이 주기보다 길었다면 놓친 틱은 건너뜀)
+                next_run += interval
+                now = time.monotonic()
+                if next_run <= now:
+                    next_run += ((now - next_run) // interval + 1) * interval
+                wait = next_run - now
+                logger.info(f"⏰ {wait / 60:.1f}분 대기 중...")
+                await asyncio.sleep(wait)
 
             except KeyboardInterrupt:
                 logger.info("🛑 기술분석 스케줄러 중지")
@@ -1014,15 +1558,26 @@ class UpbitTechnicalAnalyzer:
             except Exception as e:
                 logger.error(f"❌ 스케줄러 오류: {e}")
                 await asyncio.sleep(30)
+                next_run = time.monotonic()
 
     def close(self):
         """리소스 정리"""
         if self.write_api:
+            # 남은 배치를 모두 전송할 때까지 대기 후 종료
             self.write_api.close()
+            self._settle_pending_writes()
+        if self._sync_write_api:
+            self._sync_write_api.close()
         if self.influx_client:
             self.influx_client.close()
         logger.info("🔌 기술분석기 종료")
 
+    async def aclose(self) -> None:
+        """리소스 정리 (HTTP 세션 포함)"""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self.close()
+
 
 async def test_technical_connection():
     """기술분석 연결 테스트"""
@@ -1033,7 +1588,7 @@ async def test_technical_connection():
 
         # 간단한 분석 테스트
         test_success = await analyzer.analyze_symbol("KRW-BTC")
-        analyzer.close()
+        await analyzer.aclose()
 
         if test_success:
             print("✅ 기술분석 연결 테스트 성공!")
@@ -1074,8 +1629,11 @@ async def main():
     except Exception as e:
         logger.error(f"❌ 실행 중 오류: {e}")
     finally:
-        analyzer.close()
+        await analyzer.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
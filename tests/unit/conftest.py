@@ -0,0 +1,17 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 서비스 디렉터리 이름에 하이픈이 있어 패키지 경로로 임포트할 수 없으므로 src를 경로에 추가
+SERVICE_SRC = (
+    Path(__file__).resolve().parents[2] / "services" / "mvp-trading-service" / "src"
+)
+if str(SERVICE_SRC) not in sys.path:
+    sys.path.insert(0, str(SERVICE_SRC))
+
+# Numba 캐시는 소스 경로 기준이지만 모듈 이름을 함께 기록하므로, 스크립트로 실행할 때
+# (upbit_technical)와 테스트 임포트(data.collectors.upbit_technical)의 캐시를 분리
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR", str(Path(tempfile.gettempdir()) / "one-bailey-numba-tests")
+)
@@ -0,0 +1,108 @@
+"""보조지표 커널과 TA-Lib 결과 일치 테스트"""
+
+import numpy as np
+import pytest
+
+talib = pytest.importorskip("talib")
+
+from data.collectors import upbit_technical as ut  # noqa: E402
+
+cfg = ut.TechnicalIndicatorConfig
+
+# 데이터 부족(NaN) 구간부터 운영 조회 길이 이상까지
+LENGTHS = [5, 15, 20, 30, 34, 35, 60, 200]
+SEEDS = [0, 1, 2]
+
+
+def make_ohlc(n: int, seed: int):
+    """랜덤 워크 OHLC 배열 (high >= close/open >= low)"""
+    rng = np.random.default_rng(seed)
+    close = 50_000_000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = close * rng.uniform(0.001, 0.03, n)
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    return close, high, low
+
+
+def assert_same(actual: float, expected: float):
+    """NaN 여부까지 같고 값은 상대오차 1e-9 이내"""
+    if np.isnan(expected):
+        assert np.isnan(actual)
+    else:
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("n", LENGTHS)
+def test_fused_last_indicators_matches_talib(n: int, seed: int):
+    close, high, low = make_ohlc(n, seed)
+    sma_periods = np.array(cfg.SMA_PERIODS, dtype=np.int64)
+
+    sma_values, bb_upper, bb_middle, bb_lower, atr = ut._fused_last_indicators(
+        close,
+        high,
+        low,
+        sma_periods,
+        cfg.BB_PERIOD,
+        cfg.BB_STD_DEV,
+        cfg.ATR_PERIOD,
+    )
+
+    for period, value in zip(cfg.SMA_PERIODS, sma_values):
+        assert_same(value, talib.SMA(close, timeperiod=period)[-1])
+
+    upper, middle, lower = talib.BBANDS(
+        close,
+        timeperiod=cfg.BB_PERIOD,
+        nbdevup=cfg.BB_STD_DEV,
+        nbdevdn=cfg.BB_STD_DEV,
+        matype=0,
+    )
+    assert_same(bb_upper, upper[-1])
+    assert_same(bb_middle, middle[-1])
+    assert_same(bb_lower, lower[-1])
+
+    assert_same(atr, talib.ATR(high, low, close, timeperiod=cfg.ATR_PERIOD)[-1])
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("n", LENGTHS)
+def test_rsi_wilder_last_matches_talib(n: int, seed: int):
+    close, _, _ = make_ohlc(n, seed)
+
+    assert_same(
+        ut._rsi_wilder_last(close, cfg.RSI_PERIOD),
+        talib.RSI(close, timeperiod=cfg.RSI_PERIOD)[-1],
+    )
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("n", LENGTHS)
+def test_macd_last_matches_talib(n: int, seed: int):
+    close, _, _ = make_ohlc(n, seed)
+
+    macd, signal, hist = ut._macd_last(
+        close, cfg.MACD_FAST_PERIOD, cfg.MACD_SLOW_PERIOD, cfg.MACD_SIGNAL_PERIOD
+    )
+    expected = talib.MACD(
+        close,
+        fastperiod=cfg.MACD_FAST_PERIOD,
+        slowperiod=cfg.MACD_SLOW_PERIOD,
+        signalperiod=cfg.MACD_SIGNAL_PERIOD,
+    )
+
+    assert_same(macd, expected[0][-1])
+    assert_same(signal, expected[1][-1])
+    assert_same(hist, expected[2][-1])
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("n", LENGTHS)
+def test_atr_wilder_matches_talib(n: int, seed: int):
+    close, high, low = make_ohlc(n, seed)
+
+    assert_same(
+        ut._atr_wilder(high, low, close, cfg.ATR_PERIOD),
+        talib.ATR(high, low, close, timeperiod=cfg.ATR_PERIOD)[-1],
+    )
@@ -0,0 +1,116 @@
+"""증분 RSI/MACD/ATR 상태와 전체 재계산 결과 일치 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.collectors import upbit_technical as ut
+
+cfg = ut.TechnicalIndicatorConfig
+
+SYMBOL = "KRW-BTC"
+# 운영 조회 길이(MACD 시드 부족)와 MACD까지 채워지는 길이
+WINDOWS = [cfg.DATA_COLLECTION["daily_candles"], 60]
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """InfluxDB 연결 없이 생성한 분석기"""
+    monkeypatch.setattr(
+        ut.UpbitTechnicalAnalyzer, "_initialize_influxdb", lambda self: None
+    )
+    return ut.UpbitTechnicalAnalyzer()
+
+
+def make_candles(n: int, seed: int = 0) -> pd.DataFrame:
+    """랜덤 워크 일봉 데이터"""
+    rng = np.random.default_rng(seed)
+    close = 50_000_000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = close * rng.uniform(0.001, 0.03, n)
+    return pd.DataFrame(
+        {
+            "datetime": pd.date_range("2025-01-01", periods=n, freq="D"),
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": rng.uniform(100, 1000, n),
+        }
+    )
+
+
+def full_recompute(df: pd.DataFrame):
+    """조회 창 전체로 RSI/MACD/ATR 마지막 값 계산"""
+    close, high, low, _ = ut.UpbitTechnicalAnalyzer._extract_arrays(df)
+    return (
+        ut._rsi_wilder_last(close, cfg.RSI_PERIOD),
+        ut._macd_last(
+            close, cfg.MACD_FAST_PERIOD, cfg.MACD_SLOW_PERIOD, cfg.MACD_SIGNAL_PERIOD
+        ),
+        ut._atr_wilder(high, low, close, cfg.ATR_PERIOD),
+    )
+
+
+def incremental(analyzer, df: pd.DataFrame):
+    close, high, low, _ = analyzer._extract_arrays(df)
+    return analyzer._recurrence_values(SYMBOL, df, close, high, low)
+
+
+def assert_matches_full(values, df: pd.DataFrame):
+    """증분 값이 전체 재계산과 일치 (상태가 없어 빠진 지표는 전체 계산도 NaN)"""
+    rsi, macd, atr = full_recompute(df)
+    for name, expected in (("rsi", rsi), ("macd", macd), ("atr", atr)):
+        if name in values:
+            assert values[name] == pytest.approx(expected, rel=1e-12)
+        else:
+            assert np.isnan(expected).all()
+
+
+def tick(df: pd.DataFrame, price: float) -> pd.DataFrame:
+    """진행 중인 마지막 봉에 체결 반영 (종가 갱신, 고가/저가 확장)"""
+    df = df.copy()
+    last = df.index[-1]
+    df.loc[last, "close"] = price
+    df.loc[last, "high"] = max(df.loc[last, "high"], price)
+    df.loc[last, "low"] = min(df.loc[last, "low"], price)
+    return df
+
+
+@pytest.mark.parametrize("window", WINDOWS)
+def test_in_candle_ticks_reuse_state_and_match_full_recompute(analyzer, window):
+    candles = make_candles(window + 10)
+    df = candles.iloc[-window:].reset_index(drop=True)
+
+    assert_matches_full(incremental(analyzer, df), df)
+    state = analyzer._indicator_state[SYMBOL]["state"]
+
+    rng = np.random.default_rng(1)
+    for price in df["close"].iloc[-1] * (1 + rng.normal(0, 0.01, 20)):
+        df = tick(df, float(price))
+        assert_matches_full(incremental(analyzer, df), df)
+        # 확정 봉 구간이 그대로면 저장된 상태를 재사용
+        assert analyzer._indicator_state[SYMBOL]["state"] is state
+
+
+@pytest.mark.parametrize("window", WINDOWS)
+def test_window_slide_recomputes_state_and_matches_full_recompute(analyzer, window):
+    candles = make_candles(window + 20, seed=3)
+
+    previous_state = None
+    for start in range(20):
+        df = candles.iloc[start : start + window].reset_index(drop=True)
+        df = tick(df, float(df["close"].iloc[-1]) * 1.005)
+
+        assert_matches_full(incremental(analyzer, df), df)
+        # 새 봉이 열리면 창이 이동하므로 상태를 다시 계산
+        state = analyzer._indicator_state[SYMBOL]["state"]
+        assert state is not previous_state
+        previous_state = state
+
+
+def test_short_history_falls_back_to_full_calculation(analyzer):
+    df = make_candles(cfg.RSI_PERIOD)
+
+    # 시드 구간을 채우지 못한 지표는 결과에서 빠짐 (호출 측이 전체 계산)
+    assert incremental(analyzer, df) == {}